@@ -6,16 +6,63 @@
 from __future__ import annotations
 
 import re
-import xml.etree.ElementTree as ET  # noqa: N817
 from datetime import date
+from functools import partial
 from typing import Any, ClassVar, cast
 
-from defusedxml.ElementTree import fromstring, parse
+try:
+    from lxml import etree as ET  # noqa: N812
+
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET  # noqa: N817
+
+    HAS_LXML = False
 
 from darkseid.issue_string import IssueString
 from darkseid.metadata import Arc, Basic, Credit, ImageMetadata, Metadata, Role, Series
 from darkseid.utils import list_to_string, xlate
 
+if HAS_LXML:
+    # lxml expands entities and can fetch external resources by default, so turn those off
+    # to keep the same protection defusedxml gives the stdlib parser. Blank text is dropped
+    # so pretty printing can re-indent existing xml, and ComicInfo has no ids to collect.
+    _PARSER_OPTIONS = {
+        "resolve_entities": False,
+        "no_network": True,
+        "remove_blank_text": True,
+        "collect_ids": False,
+    }
+    fromstring = partial(ET.fromstring, parser=ET.XMLParser(**_PARSER_OPTIONS))  # noqa: S314
+    iterparse = partial(ET.iterparse, **_PARSER_OPTIONS)
+    WRITE_OPTIONS = {"encoding": "utf-8", "xml_declaration": True, "pretty_print": True}
+else:
+    from defusedxml.ElementTree import fromstring, iterparse
+
+    WRITE_OPTIONS = {"encoding": "utf-8", "xml_declaration": True}
+
+CI_NAMESPACES = {
+    "xsi": "https://www.w3.org/2001/XMLSchema-instance",
+    "xsd": "https://www.w3.org/2001/XMLSchema",
+}
+
+
+def _credit_tags_by_role(credit_roles: dict[str, frozenset[str]]) -> dict[str, tuple[str, ...]]:
+    """
+    Inverts a mapping of ComicInfo credit elements to role synonyms.
+
+    Args:
+        credit_roles (dict[str, frozenset[str]]): The role synonyms for each credit element.
+
+    Returns:
+        dict[str, tuple[str, ...]]: The credit elements each role synonym belongs to.
+    """
+    tags_by_role: dict[str, tuple[str, ...]] = {}
+    for tag, synonyms in credit_roles.items():
+        for synonym in synonyms:
+            tags_by_role[synonym] = (*tags_by_role.get(synonym, ()), tag)
+    return tags_by_role
+
 
 class ComicInfo:
     """
@@ -24,6 +71,9 @@ class ComicInfo:
     Includes methods for converting Metadata to XML, XML to Metadata, and writing/reading Metadata to/from external files.
     """
 
+    RESOURCE_SPLIT_RE = re.compile(r',|"(.*?)"')
+    XML_DECLARATION_RE = re.compile(r"^\ufeff?\s*<\?xml\s[^>]*\?>")
+
     ci_age_ratings: ClassVar[frozenset[str]] = frozenset(
         {
             "Unknown",
@@ -46,6 +96,11 @@ class ComicInfo:
 
     ci_manga: ClassVar[frozenset[str]] = frozenset({"Unknown", "Yes", "No", "YesAndRightToLeft"})
 
+    # Credit elements whose tag is also the role name; CoverArtist is stored as "Cover".
+    ci_credit_tags: ClassVar[frozenset[str]] = frozenset(
+        {"Writer", "Penciller", "Inker", "Colorist", "Letterer", "Editor"}
+    )
+
     writer_synonyms: ClassVar[frozenset[str]] = frozenset(
         {
             "writer",
@@ -108,6 +163,30 @@ class ComicInfo:
             "supervising editor",
         }
     )
+    # ComicInfo elements that map directly to a Metadata attribute, and whether they hold an int.
+    ci_simple_fields: ClassVar[dict[str, tuple[str, bool]]] = {
+        "Count": ("issue_count", True),
+        "AlternateSeries": ("alternate_series", False),
+        "AlternateCount": ("alternate_count", True),
+        "Summary": ("comments", False),
+        "Notes": ("notes", False),
+        "Web": ("web_link", False),
+        "Manga": ("manga", False),
+        "PageCount": ("page_count", True),
+        "ScanInformation": ("scan_info", False),
+        "SeriesGroup": ("series_group", False),
+        "AgeRating": ("age_rating", False),
+    }
+    credit_roles: ClassVar[dict[str, frozenset[str]]] = {
+        "Writer": writer_synonyms,
+        "Penciller": penciller_synonyms,
+        "Inker": inker_synonyms,
+        "Colorist": colorist_synonyms,
+        "Letterer": letterer_synonyms,
+        "CoverArtist": cover_synonyms,
+        "Editor": editor_synonyms,
+    }
+    credit_tags_by_role: ClassVar[dict[str, tuple[str, ...]]] = _credit_tags_by_role(credit_roles)
 
     def metadata_from_string(self: ComicInfo, string: str) -> Metadata:
         """
@@ -119,6 +198,10 @@ class ComicInfo:
         Returns:
             Metadata: The parsed Metadata object.
         """
+        if HAS_LXML:
+            # lxml refuses str input that carries an encoding declaration. The text is already
+            # decoded, so drop the declaration, matching how the stdlib parser treats str input.
+            string = ComicInfo.XML_DECLARATION_RE.sub("", string, count=1)
         tree = ET.ElementTree(fromstring(string))
         return self.convert_xml_to_metadata(tree)
 
@@ -138,7 +221,7 @@ class ComicInfo:
             str: The XML string representation of the Metadata object.
         """
         tree = self.convert_metadata_to_xml(md, xml)
-        return ET.tostring(tree.getroot(), encoding="utf-8", xml_declaration=True).decode()
+        return ET.tostring(tree.getroot(), **WRITE_OPTIONS).decode()
 
     @classmethod
     def _split_sting(cls: type[ComicInfo], string: str, delimiters: list[str]) -> list[str]:
@@ -152,7 +235,7 @@ class ComicInfo:
         Returns:
             list[str]: The list of substrings after splitting the string.
         """
-        for delimiter in delimiters:
+        for delimiter in delimiters[1:]:
             string = string.replace(delimiter, delimiters[0])
         return string.split(delimiters[0])
 
@@ -167,10 +250,20 @@ class ComicInfo:
         Returns:
             ET.Element: The root element of the XML object.
         """
-        root = ET.ElementTree(fromstring(xml)).getroot() if xml else ET.Element("ComicInfo")
-        root.attrib["xmlns:xsi"] = "https://www.w3.org/2001/XMLSchema-instance"
-        root.attrib["xmlns:xsd"] = "https://www.w3.org/2001/XMLSchema"
-
+        if not HAS_LXML:
+            root = fromstring(xml) if xml else ET.Element("ComicInfo")
+            for prefix, uri in CI_NAMESPACES.items():
+                root.attrib[f"xmlns:{prefix}"] = uri
+            return root
+
+        # lxml only accepts namespace declarations when an element is created, so rebuild
+        # the root of any existing xml with them in place.
+        if not xml:
+            return ET.Element("ComicInfo", nsmap=CI_NAMESPACES)
+        existing = fromstring(xml)
+        root = ET.Element(existing.tag, existing.attrib, nsmap={**existing.nsmap, **CI_NAMESPACES})
+        root.text = existing.text
+        root.extend(existing)
         return root
 
     @classmethod
@@ -207,16 +300,21 @@ class ComicInfo:
             ET.ElementTree: The XML representation of the Metadata object.
         """
         root = self._get_root(xml)
+        # Index the elements of any existing xml once, rather than searching the root for
+        # every field. For new xml this is empty and every field is simply appended.
+        existing: dict[str, ET.Element] = {}
+        for child in root:
+            existing.setdefault(child.tag, child)
 
         def assign(cix_entry: str, md_entry: str | int | None) -> None:
-            et_entry = root.find(cix_entry)
+            et_entry = existing.get(cix_entry)
             if md_entry is not None and md_entry:
                 if et_entry is not None:
                     et_entry.text = str(md_entry)
                 else:
                     ET.SubElement(root, cix_entry).text = str(md_entry)
             elif et_entry is not None:
-                root.remove(et_entry)
+                root.remove(existing.pop(cix_entry))
 
         def get_resource_list(resource: list[Basic] | list[Arc]) -> str | None:
             return list_to_string([i.name for i in resource]) if resource else None
@@ -239,27 +337,17 @@ class ComicInfo:
             assign("Month", md.cover_date.month)
             assign("Day", md.cover_date.day)
 
-        credit_roles = {
-            "Writer": self.writer_synonyms,
-            "Penciller": self.penciller_synonyms,
-            "Inker": self.inker_synonyms,
-            "Colorist": self.colorist_synonyms,
-            "Letterer": self.letterer_synonyms,
-            "CoverArtist": self.cover_synonyms,
-            "Editor": self.editor_synonyms,
-        }
-
-        credit_lists = {role: [] for role in credit_roles}
+        credit_lists: dict[str, list[str]] = {role: [] for role in self.credit_roles}
 
         for credit in md.credits:
+            person = credit.person.replace(",", "")
             for r in credit.role:
-                role_name = r.name.casefold()
-                for role, synonyms in credit_roles.items():
-                    if role_name in synonyms:
-                        credit_lists[role].append(credit.person.replace(",", ""))
+                for role in self.credit_tags_by_role.get(r.name.casefold(), ()):
+                    credit_lists[role].append(person)
 
+        # Commas were stripped from the names, so they can be joined without quoting.
         for role, names in credit_lists.items():
-            assign(role, list_to_string(names))
+            assign(role, ", ".join(names))
 
         if md.publisher:
             assign("Publisher", md.publisher.name)
@@ -282,7 +370,7 @@ class ComicInfo:
         assign("AgeRating", self.validate_value(md.age_rating, self.ci_age_ratings))
 
         #  loop and add the page entries under pages node
-        pages_node = root.find("Pages")
+        pages_node = existing.get("Pages")
         if pages_node is not None:
             pages_node.clear()
         else:
@@ -290,10 +378,11 @@ class ComicInfo:
 
         for page_dict in md.pages:
             page_dict["Image"] = str(page_dict.get("Image", ""))
-            page_node = ET.SubElement(pages_node, "Page")
-            page_node.attrib = dict(sorted(page_dict.items()))
+            ET.SubElement(pages_node, "Page", attrib=dict(sorted(page_dict.items())))
 
-        ET.indent(root)
+        # lxml indents while serializing, the stdlib needs the tree indented beforehand.
+        if not HAS_LXML:
+            ET.indent(root)
         return ET.ElementTree(root)
 
     def convert_xml_to_metadata(self: ComicInfo, tree: ET.ElementTree) -> Metadata:
@@ -311,82 +400,112 @@ class ComicInfo:
         if root.tag != "ComicInfo":
             raise ValueError("Metadata is not ComicInfo format")
 
-        def get(txt: str) -> str | int | None:
-            """
-            Finds and returns the text content of a specific tag in an XML tree.
+        fields: dict[str, str | None] = {}
+        credit_elements: list[tuple[str, str | None]] = []
+        pages: list[dict[str, str]] = []
+        for child in root:
+            self._collect_element(child, fields, credit_elements, pages)
 
-            Args:
-                txt (str): The tag to search for.
+        return self._convert_fields_to_metadata(fields, credit_elements, pages)
 
-            Returns:
-                str | int | None: The text content of the tag, or None if the tag is not found.
-            """
-            tag = root.find(txt)
-            return None if tag is None else tag.text
+    def _collect_element(
+        self: ComicInfo,
+        elem: ET.Element,
+        fields: dict[str, str | None],
+        credit_elements: list[tuple[str, str | None]],
+        pages: list[dict[str, str]],
+    ) -> None:
+        """
+        Collects the data of a top-level ComicInfo element.
 
+        Args:
+            elem (ET.Element): The top-level element to collect.
+            fields (dict[str, str | None]): The text of the first element for each tag.
+            credit_elements (list[tuple[str, str | None]]): The tag and text of every credit element.
+            pages (list[dict[str, str]]): The attributes of each Page element.
+
+        Returns:
+            None
+        """
+        # lxml keeps comments and processing instructions, whose tag is not a string.
+        if not isinstance(elem.tag, str):
+            return
+        if elem.tag == "Pages":
+            pages.extend(dict(page.attrib) for page in elem if page.tag == "Page")
+        elif elem.tag in self.ci_credit_tags or elem.tag == "CoverArtist":
+            credit_elements.append((elem.tag, elem.text))
+        else:
+            fields.setdefault(elem.tag, elem.text)
+
+    def _convert_fields_to_metadata(
+        self: ComicInfo,
+        fields: dict[str, str | None],
+        credit_elements: list[tuple[str, str | None]],
+        pages: list[dict[str, str]],
+    ) -> Metadata:
+        """
+        Converts the text of the top-level ComicInfo elements to a Metadata object.
+
+        Args:
+            fields (dict[str, str | None]): The text of each top-level element, keyed by tag.
+            credit_elements (list[tuple[str, str | None]]): The tag and text of every credit element.
+            pages (list[dict[str, str]]): The attributes of each Page element.
+
+        Returns:
+            Metadata: The Metadata object built from the fields and pages.
+        """
         md = Metadata()
-        md.series = Series(name=xlate(get("Series")))
-        md.stories = self.string_to_resource(xlate(get("Title")))
-        md.issue = IssueString(xlate(get("Number"))).as_string()
-        md.issue_count = xlate(get("Count"), True)
-        md.series.volume = xlate(get("Volume"), True)
-        md.alternate_series = xlate(get("AlternateSeries"))
-        md.alternate_number = IssueString(xlate(get("AlternateNumber"))).as_string()
-        md.alternate_count = xlate(get("AlternateCount"), True)
-        md.comments = xlate(get("Summary"))
-        md.notes = xlate(get("Notes"))
+        md.series = Series(name=xlate(fields.get("Series")))
+        md.stories = self.string_to_resource(xlate(fields.get("Title")))
+        md.issue = IssueString(xlate(fields.get("Number"))).as_string()
+        md.series.volume = xlate(fields.get("Volume"), True)
+        md.alternate_number = IssueString(xlate(fields.get("AlternateNumber"))).as_string()
         # Cover Year
-        tmp_year = xlate(get("Year"), True)
-        tmp_month = xlate(get("Month"), True)
-        tmp_day = xlate(get("Day"), True)
+        tmp_year = xlate(fields.get("Year"), True)
+        tmp_month = xlate(fields.get("Month"), True)
+        tmp_day = xlate(fields.get("Day"), True)
         if tmp_year is not None and tmp_month is not None:
             if tmp_day is not None:
                 md.cover_date = date(tmp_year, tmp_month, tmp_day)
             else:
                 md.cover_date = date(tmp_year, tmp_month, 1)
 
-        md.publisher = Basic(xlate(get("Publisher")))
-        if imprint := xlate(get("Imprint")):  # Make sure Imprint element is present.
+        md.publisher = Basic(xlate(fields.get("Publisher")))
+        if imprint := xlate(fields.get("Imprint")):  # Make sure Imprint element is present.
             md.imprint = Basic(imprint)
-        md.genres = self.string_to_resource(xlate(get("Genre")))
-        md.web_link = xlate(get("Web"))
-        md.series.language = xlate(get("LanguageISO"))
-        md.series.format = xlate(get("Format"))
-        md.manga = xlate(get("Manga"))
-        md.characters = self.string_to_resource(xlate(get("Characters")))
-        md.teams = self.string_to_resource(xlate(get("Teams")))
-        md.locations = self.string_to_resource(xlate(get("Locations")))
-        md.page_count = xlate(get("PageCount"), True)
-        md.scan_info = xlate(get("ScanInformation"))
-        md.story_arcs = self.string_to_arc(xlate(get("StoryArc")))
-        md.series_group = xlate(get("SeriesGroup"))
-        md.age_rating = xlate(get("AgeRating"))
-
-        tmp = xlate(get("BlackAndWhite"))
+        md.genres = self.string_to_resource(xlate(fields.get("Genre")))
+        md.series.language = xlate(fields.get("LanguageISO"))
+        md.series.format = xlate(fields.get("Format"))
+        md.characters = self.string_to_resource(xlate(fields.get("Characters")))
+        md.teams = self.string_to_resource(xlate(fields.get("Teams")))
+        md.locations = self.string_to_resource(xlate(fields.get("Locations")))
+        md.story_arcs = self.string_to_arc(xlate(fields.get("StoryArc")))
+
+        tmp = xlate(fields.get("BlackAndWhite"))
         md.black_and_white = False
         if tmp is not None and tmp.casefold() in ["yes", "true", "1"]:
             md.black_and_white = True
+        # Now extract the remaining simple fields
+        for tag, text in fields.items():
+            if field_spec := self.ci_simple_fields.get(tag):
+                attr, is_int = field_spec
+                setattr(md, attr, xlate(text, is_int))
+
         # Now extract the credit info
-        for n in root:
-            if (
-                n.tag in ["Writer", "Penciller", "Inker", "Colorist", "Letterer", "Editor"]
-                and n.text is not None
-            ):
-                for name in self._split_sting(n.text, [";"]):
-                    md.add_credit(Credit(name.strip(), [Role(n.tag)]))
-
-            if n.tag == "CoverArtist" and n.text is not None:
-                for name in self._split_sting(n.text, [";"]):
+        for tag, text in credit_elements:
+            if tag in self.ci_credit_tags and text is not None:
+                for name in self._split_sting(text, [";"]):
+                    md.add_credit(Credit(name.strip(), [Role(tag)]))
+            elif tag == "CoverArtist" and text is not None:
+                for name in self._split_sting(text, [";"]):
                     md.add_credit(Credit(name.strip(), [Role("Cover")]))
 
         # parse page data now
-        pages_node = root.find("Pages")
-        if pages_node is not None:
-            for page in pages_node:
-                p: dict[str, Any] = page.attrib
-                if "Image" in p:
-                    p["Image"] = int(p["Image"])
-                md.pages.append(cast(ImageMetadata, p))
+        for page in pages:
+            p: dict[str, Any] = page
+            if "Image" in p:
+                p["Image"] = int(p["Image"])
+            md.pages.append(cast(ImageMetadata, p))
 
         md.is_empty = False
 
@@ -410,7 +529,7 @@ class ComicInfo:
             None
         """
         tree = self.convert_metadata_to_xml(md, xml)
-        tree.write(filename, encoding="utf-8", xml_declaration=True)
+        tree.write(filename, **WRITE_OPTIONS)
 
     def read_from_external_file(self: ComicInfo, filename: str) -> Metadata:
         """
@@ -422,8 +541,28 @@ class ComicInfo:
         Returns:
             Metadata: The Metadata object extracted from the file.
         """
-        tree = parse(filename)
-        return self.convert_xml_to_metadata(tree)
+        fields: dict[str, str | None] = {}
+        credit_elements: list[tuple[str, str | None]] = []
+        pages: list[dict[str, str]] = []
+        depth = 0
+        # Stream the file and discard each top-level element once its data is collected, so
+        # large files are read in a single pass without holding the whole tree in memory.
+        for event, elem in iterparse(filename, events=("start", "end")):
+            if event == "start":
+                if depth == 0 and elem.tag != "ComicInfo":
+                    raise ValueError("Metadata is not ComicInfo format")
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 1:
+                continue
+            self._collect_element(elem, fields, credit_elements, pages)
+            elem.clear()
+            if HAS_LXML:
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+        return self._convert_fields_to_metadata(fields, credit_elements, pages)
 
     @staticmethod
     def clean_resource_list(string: str) -> list[str]:
@@ -436,7 +575,11 @@ class ComicInfo:
         Returns:
             list[str]: The list of cleaned and filtered non-empty values.
         """
-        return [item.strip() for item in re.split(r',|"(.*?)"', string) if item and item.strip()]
+        return [
+            stripped
+            for item in ComicInfo.RESOURCE_SPLIT_RE.split(string)
+            if item and (stripped := item.strip())
+        ]
 
     @staticmethod
     def string_to_resource(string: str) -> list[Basic] | None:
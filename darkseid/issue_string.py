@@ -9,6 +9,8 @@ e.g.: "12", "12.1", "0", "-1", "5AU", "100-2"
 
 from __future__ import annotations
 
+import re
+
 
 class IssueString:
     """
@@ -16,6 +18,9 @@ class IssueString:
     different formats.
     """
 
+    # Digits with at most one decimal point, so a second "." starts the suffix.
+    NUMERIC_RE = re.compile(r"[0-9]*(?:\.[0-9]*)?")
+
     def __init__(self: IssueString, text: str) -> None:
         # sourcery skip: remove-unnecessary-cast
         """
@@ -114,20 +119,8 @@ class IssueString:
             int: The index where the numeric part ends.
         """
 
-        # walk through the string, look for split point (the first non-numeric)
-        decimal_count: int = 0
-        for idx in range(start, len(text)):
-            if text[idx] not in "0123456789.":
-                break
-            # special case: also split on second "."
-            if text[idx] == ".":
-                decimal_count += 1
-                if decimal_count > 1:
-                    break
-        else:
-            idx = len(text)
-
-        return idx
+        # the split point is the end of the numeric run (the first non-numeric or second ".")
+        return IssueString.NUMERIC_RE.match(text, start).end()
 
     def as_string(self: IssueString, pad: int = 0) -> str:
         """
@@ -3,9 +3,11 @@
 # Copyright 2019 Brian Pepple
 
 import itertools
-from collections import defaultdict
+import re
 from pathlib import Path
 
+NON_DIGIT_RE = re.compile(r"[^0-9]")
+
 
 def get_recursive_filelist(path_list: list[Path]) -> list[Path]:
     """
@@ -120,12 +122,7 @@ def xlate(data: int | str | None, is_int: bool = False) -> int | str | None:
     if data is None or data == "":
         return None
     if is_int:
-        i = str(data).translate(
-            defaultdict(
-                lambda: None,
-                zip((ord(c) for c in "1234567890"), "1234567890", strict=False),
-            ),
-        )
+        i = NON_DIGIT_RE.sub("", str(data))
         if i == "0":
             return "0"
         return int(i) if i else None
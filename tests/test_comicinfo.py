@@ -4,9 +4,10 @@ from datetime import date
 from pathlib import Path
 
 import pytest
+from defusedxml.common import EntitiesForbidden
 from lxml import etree
 
-from darkseid.comicinfo import ComicInfo
+from darkseid.comicinfo import HAS_LXML, ComicInfo
 from darkseid.metadata import Arc, Basic, Credit, Metadata, Role, Series
 
 CI_XSD = Path("tests/test_files/ComicInfo.xsd")
@@ -180,3 +181,157 @@ def test_read_from_file(test_meta_data: Metadata, tmp_path: Path) -> None:
     assert new_md.black_and_white == test_meta_data.black_and_white
     assert new_md.publisher.name == test_meta_data.publisher.name
     assert new_md.imprint.name == test_meta_data.imprint.name
+
+
+def test_metadata_from_string(test_meta_data: Metadata) -> None:
+    """Test round tripping the metadata through an xml string."""
+    ci = ComicInfo()
+    test_meta_data.set_default_page_list(3)
+    new_md = ci.metadata_from_string(ci.string_from_metadata(test_meta_data))
+    assert new_md.series.name == test_meta_data.series.name
+    assert new_md.issue == test_meta_data.issue
+    assert new_md.credits[0] == test_meta_data.credits[0]
+    assert new_md.characters == test_meta_data.characters
+    assert len(new_md.pages) == 3
+    assert new_md.pages[0]["Image"] == 0
+
+
+def test_string_from_metadata_with_existing_xml(test_meta_data: Metadata) -> None:
+    """Test updating existing xml only replaces the fields present in the metadata."""
+    ci = ComicInfo()
+    existing = ci.string_from_metadata(test_meta_data).encode("utf-8")
+    new_md = Metadata(series=Series("Batman"), issue="2")
+    res = ci.metadata_from_string(ci.string_from_metadata(new_md, existing))
+    assert res.series.name == "Batman"
+    assert res.issue == "2"
+    assert res.characters is None
+    assert res.publisher.name == test_meta_data.publisher.name
+
+
+def test_read_from_non_comicinfo_file(tmp_path: Path) -> None:
+    """Test reading a file that isn't ComicInfo raises an error."""
+    tmp_file = tmp_path / "test-bad.xml"
+    tmp_file.write_text("<MetronInfo><Series>Aquaman</Series></MetronInfo>")
+    with pytest.raises(ValueError, match="Metadata is not ComicInfo format"):
+        ComicInfo().read_from_external_file(tmp_file)
+
+
+def test_credit_synonyms_to_xml() -> None:
+    """Test credit roles are written to every ComicInfo element they are a synonym for."""
+    md = Metadata(series=Series("Aquaman"))
+    md.add_credit(Credit("Jim Aparo", [Role("Artist")]))
+    md.add_credit(Credit("Doe, Jane", [Role("Plot"), Role("Cover Artist")]))
+    md.add_credit(Credit("Bob Rozakis", [Role("Senior Editor")]))
+    md.add_credit(Credit("Nobody", [Role("Translator")]))
+    root = etree.fromstring(ComicInfo().string_from_metadata(md).encode("utf-8"))
+    assert root.findtext("Writer") == "Doe Jane"
+    assert root.findtext("Penciller") == "Jim Aparo"
+    assert root.findtext("Inker") == "Jim Aparo"
+    assert root.findtext("CoverArtist") == "Doe Jane"
+    assert root.findtext("Editor") == "Bob Rozakis"
+    assert root.find("Colorist") is None
+    assert root.find("Letterer") is None
+
+
+def test_clean_resource_list() -> None:
+    """Test splitting a resource string with quoted items and empty values."""
+    res = ComicInfo.clean_resource_list('Aquaman, "Mera, Queen of Atlantis",, Garth ,  ')
+    assert res == ["Aquaman", "Mera, Queen of Atlantis", "Garth"]
+
+
+def test_split_string() -> None:
+    """Test splitting a string on multiple delimiters."""
+    assert ComicInfo._split_sting("a;b|c", [";", "|"]) == ["a", "b", "c"]  # noqa: SLF001
+    assert ComicInfo._split_sting("a; b", [";"]) == ["a", " b"]  # noqa: SLF001
+
+
+def test_credits_from_xml() -> None:
+    """Test reading the credit elements, including multiple names and the cover artist."""
+    xml = (
+        "<?xml version='1.0' encoding='utf-8'?>"
+        "<ComicInfo><Writer>Peter David; Kurt Busiek</Writer>"
+        "<CoverArtist>Martin Egeland</CoverArtist><Colorist/></ComicInfo>"
+    )
+    md = ComicInfo().metadata_from_string(xml)
+    assert md.credits == [
+        Credit("Peter David", [Role("Writer")]),
+        Credit("Kurt Busiek", [Role("Writer")]),
+        Credit("Martin Egeland", [Role("Cover")]),
+    ]
+
+
+def test_read_does_not_resolve_external_entities(tmp_path: Path) -> None:
+    """
+    Test external entities in ComicInfo xml are never expanded.
+
+    lxml leaves the entity reference unexpanded, while the defusedxml fallback rejects the document.
+    """
+    secret = tmp_path / "secret.txt"
+    secret.write_text("top secret")
+    xml = (
+        f'<!DOCTYPE ComicInfo [<!ENTITY xxe SYSTEM "{secret.as_uri()}">]>'
+        "<ComicInfo><Series>&xxe;</Series><Notes>Safe</Notes></ComicInfo>"
+    )
+    tmp_file = tmp_path / "test-entity.xml"
+    tmp_file.write_text(xml)
+    ci = ComicInfo()
+    for read, source in (
+        (ci.read_from_external_file, tmp_file),
+        (ci.metadata_from_string, xml),
+    ):
+        if HAS_LXML:
+            md = read(source)
+            assert md.series.name is None
+            assert md.notes == "Safe"
+        else:
+            with pytest.raises(EntitiesForbidden):
+                read(source)
+
+
+def test_duplicate_credit_elements(tmp_path: Path) -> None:
+    """Test every repeated credit element is read, while other fields keep the first value."""
+    xml = (
+        "<?xml version='1.0' encoding='utf-8'?>"
+        "<ComicInfo><Series>Aquaman</Series><Series>Batman</Series>"
+        "<Writer>Peter David</Writer><Writer>Kurt Busiek</Writer>"
+        "<CoverArtist>Martin Egeland</CoverArtist><CoverArtist>Howard Shum</CoverArtist>"
+        "</ComicInfo>"
+    )
+    expected = [
+        Credit("Peter David", [Role("Writer")]),
+        Credit("Kurt Busiek", [Role("Writer")]),
+        Credit("Martin Egeland", [Role("Cover")]),
+        Credit("Howard Shum", [Role("Cover")]),
+    ]
+    tmp_file = tmp_path / "test-duplicates.xml"
+    tmp_file.write_text(xml)
+    for md in (
+        ComicInfo().metadata_from_string(xml),
+        ComicInfo().read_from_external_file(tmp_file),
+    ):
+        assert md.series.name == "Aquaman"
+        assert md.credits == expected
+
+
+def test_comments_are_ignored(tmp_path: Path) -> None:
+    """Test xml comments are not read as fields or pages."""
+    xml = (
+        "<?xml version='1.0' encoding='utf-8'?>"
+        "<ComicInfo><!-- series --><Series>Aquaman</Series>"
+        "<Pages><!-- p --><Page Image='0'/><Page Image='1'/></Pages></ComicInfo>"
+    )
+    tmp_file = tmp_path / "test-comments.xml"
+    tmp_file.write_text(xml)
+    for md in (
+        ComicInfo().metadata_from_string(xml),
+        ComicInfo().read_from_external_file(tmp_file),
+    ):
+        assert md.series.name == "Aquaman"
+        assert md.pages == [{"Image": 0}, {"Image": 1}]
+
+
+def test_metadata_from_string_ignores_declared_encoding() -> None:
+    """Test already decoded xml isn't re-encoded using its declared encoding."""
+    xml = "<?xml version='1.0' encoding='ISO-8859-1'?><ComicInfo><Series>Café</Series></ComicInfo>"
+    md = ComicInfo().metadata_from_string(xml)
+    assert md.series.name == "Café"
@@ -11,6 +11,8 @@ float_test_values = {
     ("22.BEY", 22.0),
     ("22A", 22.0),
     ("22-A", 22.0),
+    ("1.2.3", 1.2),
+    ("-5", -5.0),
 }
 
 
@@ -32,6 +34,10 @@ string_test_values = {
     ("1.MU", "001.MU", 3),
     ("-1", "-001", 3),
     ("Test", "Test", 0),
+    ("5AU", "5AU", 0),
+    ("100-2", "100-2", 0),
+    ("1.2.3", "1.2.3", 0),
+    ("-.A", "-.A", 0),
 }
 
 
@@ -82,3 +82,24 @@ def test_recursive_list_with_directory(tmp_path: Path) -> None:
     result = utils.get_recursive_filelist(file_list)
 
     assert result == expected_result
+
+
+test_xlate_values = [
+    pytest.param(None, False, None, "None value"),
+    pytest.param("", True, None, "Empty string"),
+    pytest.param(12, False, "12", "Int to string"),
+    pytest.param("12", True, 12, "Numeric string to int"),
+    pytest.param("#12 (of 4)", True, 124, "Non-digit characters dropped"),
+    pytest.param("0", True, "0", "Zero is returned as a string"),
+    pytest.param("abc", True, None, "No digits"),
+]
+
+
+@pytest.mark.parametrize(("data", "is_int", "expected", "reason"), test_xlate_values)
+def test_xlate(
+    data: int | str | None,
+    is_int: bool,
+    expected: int | str | None,
+    reason: str,  # noqa: ARG001
+) -> None:
+    assert utils.xlate(data, is_int) == expected